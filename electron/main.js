@@ -1826,6 +1826,11 @@ ipcMain.handle('ask-about-screen', async (event, question) => {
 });
 
 // Gemini Live Service Functions
+
+// Frame layout of live.py's stdout (see FRAME_HEADER in live.py)
+const GEMINI_FRAME_HEADER_SIZE = 5;
+const GEMINI_FRAME_AUDIO = 1;
+
 async function startGeminiLiveService() {
   if (geminiLiveProcess) {
     console.log('🤖 Gemini Live service already running');
@@ -1861,9 +1866,27 @@ async function startGeminiLiveService() {
     });
 
     // Handle process output
+    // stdout carries length-prefixed frames: 1-byte kind, 4-byte big-endian length, payload
+    let stdoutBuffer = Buffer.alloc(0);
     geminiLiveProcess.stdout.on('data', (data) => {
-      const output = data.toString().trim();
-      if (output) {
+      stdoutBuffer = stdoutBuffer.length ? Buffer.concat([stdoutBuffer, data]) : data;
+
+      while (stdoutBuffer.length >= GEMINI_FRAME_HEADER_SIZE) {
+        const kind = stdoutBuffer.readUInt8(0);
+        const length = stdoutBuffer.readUInt32BE(1);
+        const frameEnd = GEMINI_FRAME_HEADER_SIZE + length;
+        if (stdoutBuffer.length < frameEnd) break; // wait for the rest of the frame
+
+        const payload = stdoutBuffer.subarray(GEMINI_FRAME_HEADER_SIZE, frameEnd);
+        stdoutBuffer = stdoutBuffer.subarray(frameEnd);
+
+        if (kind === GEMINI_FRAME_AUDIO) {
+          // Raw PCM; the renderer still expects base64
+          handleGeminiLiveEvent({ type: 'audio', data: { data: payload.toString('base64') } });
+          continue;
+        }
+
+        const output = payload.toString('utf8');
         console.log('🤖 Gemini Live stdout:', output);
         try {
           const event = JSON.parse(output);
@@ -7,27 +7,38 @@ Quickstart: https://github.com/google-gemini/cookbook/blob/main/quickstarts/Get_
 To install the dependencies for this script, run:
 
 ```
-pip install google-genai opencv-python pyaudio pillow mss
+pip install google-genai opencv-python pyaudio mss numpy simplejpeg orjson
 ```
 """
 
 import os
 import asyncio
 import base64
-import io
 import traceback
 import sys
 import json
+import struct
 import threading
 import time
-from queue import Queue
+from collections import OrderedDict
+from itertools import count
 from concurrent.futures import ThreadPoolExecutor
 
 import cv2
+import numpy as np
 import pyaudio
-import PIL.Image
 import mss
 
+try:
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import argparse
 
 from google import genai
@@ -38,6 +49,19 @@ CHANNELS = 1
 SEND_SAMPLE_RATE = 16000
 RECEIVE_SAMPLE_RATE = 24000
 CHUNK_SIZE = 1024
+# Mic reads are batched so the event loop wakes ~4x/s instead of per 64 ms chunk
+MIC_BATCH_SIZE = CHUNK_SIZE * 4
+# Upper bound on received audio coalesced into one speaker write
+PLAYBACK_BATCH_BYTES = 32 * 1024
+
+# Electron stdout protocol: every message is framed as a 1-byte kind and a
+# 4-byte big-endian payload length, followed by the payload itself
+FRAME_HEADER = struct.Struct(">BI")
+FRAME_JSON = 0   # UTF-8 JSON event
+FRAME_AUDIO = 1  # raw 16-bit PCM at RECEIVE_SAMPLE_RATE
+
+# Per-frame screen_frame/camera_frame events are debugging aids only
+DEBUG_FRAME_EVENTS = os.environ.get("RED_DEBUG_FRAMES") == "1"
 
 MODEL = "models/gemini-2.0-flash-exp"
 
@@ -63,28 +87,164 @@ CONFIG = types.LiveConnectConfig(
 
 pya = pyaudio.PyAudio()
 
-# Thread pool for Python 3.9 compatibility (replaces asyncio.to_thread)
-thread_pool = ThreadPoolExecutor(max_workers=4)
+# Resolve the default mic once at import. None means there is no input
+# device (e.g. headless machines); opening the mic then fails and
+# _open_streams carries on without it
+try:
+    DEFAULT_INPUT_DEVICE_INDEX = pya.get_default_input_device_info()["index"]
+except IOError:
+    DEFAULT_INPUT_DEVICE_INDEX = None
+
+# Thread pools for Python 3.9 compatibility (replaces asyncio.to_thread).
+# Split by role so a blocking input() or a slow frame grab can't starve mic reads.
+stdin_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stdin")
+audio_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="audio")
+video_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="video")
+
+
+def shutdown_thread_pools():
+    """Release executor threads without waiting on a pending input() call"""
+    for pool in (stdin_pool, video_pool):
+        pool.shutdown(wait=False, cancel_futures=True)
+    # Cancelling the audio tasks doesn't stop a PortAudio read()/write()
+    # already running on a worker; wait for it (mic reads return within
+    # ~256 ms) so the streams are never closed underneath it
+    audio_pool.shutdown(wait=True, cancel_futures=True)
+
+
+def json_dumps(obj):
+    """Serialize obj to compact JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# Accepts str, bytes or memoryview; orjson.JSONDecodeError subclasses
+# json.JSONDecodeError
+if orjson is not None:
+    json_loads = orjson.loads
+else:
+    def json_loads(data):
+        """Parse JSON with the stdlib, which doesn't take memoryviews"""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+# Single-pass Huffman coding and 4:2:0 chroma subsampling: the cheapest
+# encode settings, and the size difference is irrelevant for a 1 fps feed
+_CV2_JPEG_PARAMS = [cv2.IMWRITE_JPEG_OPTIMIZE, 0]
+if hasattr(cv2, "IMWRITE_JPEG_SAMPLING_FACTOR"):
+    _CV2_JPEG_PARAMS += [cv2.IMWRITE_JPEG_SAMPLING_FACTOR, cv2.IMWRITE_JPEG_SAMPLING_FACTOR_420]
+
+
+def encode_jpeg(image, colorspace="BGR", quality=75):
+    """Encode an ndarray as JPEG, preferring libjpeg-turbo via simplejpeg"""
+    if simplejpeg is not None:
+        return simplejpeg.encode_jpeg(
+            image,
+            quality=quality,
+            colorspace=colorspace,
+            colorsubsampling="420",
+            fastdct=True,
+        )
+    # Fall back to OpenCV, which expects BGR(A) input
+    if colorspace == "RGB":
+        image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+    ok, buf = cv2.imencode(
+        ".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality] + _CV2_JPEG_PARAMS
+    )
+    if not ok:
+        raise ValueError("JPEG encoding failed")
+    return buf.tobytes()
+
+
+def downscale(image, max_width, max_height=None):
+    """Shrink an ndarray image to fit the given bounds, keeping the aspect ratio"""
+    height, width = image.shape[:2]
+    if width <= max_width and (max_height is None or height <= max_height):
+        # Already small enough (the common webcam case): no resize, no copy
+        return image
+    scale = max_width / width
+    if max_height is not None:
+        scale = min(scale, max_height / height)
+    return cv2.resize(
+        image,
+        (int(width * scale), int(height * scale)),
+        interpolation=cv2.INTER_AREA,
+    )
+
+
+class AudioRingBuffer:
+    """
+    PCM byte buffer between the websocket reader and the playback task.
+    Both ends run on the event loop thread, so no locking is needed. put()
+    never blocks, so the websocket reader is never held up by playback;
+    the turn-end clear() keeps the buffer small, and capacity is only a
+    memory guard past which the oldest audio is dropped.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._buf = bytearray()
+        self._data_ready = asyncio.Event()
+
+    @property
+    def read_available(self):
+        return len(self._buf)
+
+    def put(self, data):
+        """Append PCM bytes without waiting on playback"""
+        self._buf.extend(data)
+        overflow = len(self._buf) - self.capacity
+        if overflow > 0:
+            del self._buf[:overflow]
+            print(f"Playback backlog over capacity, dropped {overflow} bytes of audio", file=sys.stderr)
+        self._data_ready.set()
+
+    def pop(self, size):
+        """Remove and return up to size bytes from the front of the buffer"""
+        chunk = bytes(self._buf[:size])
+        del self._buf[:size]
+        if not self._buf:
+            self._data_ready.clear()
+        return chunk
+
+    def clear(self):
+        """Drop all buffered audio by swapping in a fresh buffer"""
+        self._buf = bytearray()
+        self._data_ready.clear()
+
+    async def wait(self):
+        """Wait until there is audio to read"""
+        await self._data_ready.wait()
 
 
 class AudioLoop:
     def __init__(self, video_mode=DEFAULT_MODE):
         self.video_mode = video_mode
 
-        self.audio_in_queue = None
+        self.audio_in_ring = None
         self.out_queue = None
 
         self.session = None
 
+        self.audio_stream = None
+        self.play_stream = None
+
+        # Screen grabber, created lazily on first capture
+        self._sct = None
+        self._sct_lock = threading.Lock()
+
         self.send_text_task = None
         self.receive_audio_task = None
         self.play_audio_task = None
 
     async def send_text(self):
+        loop = asyncio.get_running_loop()
         while True:
-            loop = asyncio.get_event_loop()
             text = await loop.run_in_executor(
-                thread_pool,
+                stdin_pool,
                 input,
                 "message > ",
             )
@@ -98,37 +258,61 @@ class AudioLoop:
                 turn_complete=True
             )
 
+    def _open_camera(self):
+        """Open the default camera tuned for low-latency capture"""
+        cap = cv2.VideoCapture(0)  # 0 represents the default camera
+        if not cap.isOpened():
+            # No camera: grab() will fail and the capture loop ends quietly
+            return cap
+        # Keep only the newest frame queued in the driver
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        # Prefer MJPG so the camera does the JPEG compression for us
+        mjpg = cv2.VideoWriter_fourcc(*"MJPG")
+        cap.set(cv2.CAP_PROP_FOURCC, mjpg)
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1024)
+        if cap.getBackendName() == "V4L2" and int(cap.get(cv2.CAP_PROP_FOURCC)) == mjpg:
+            # V4L2 hands back the undecoded JPEG payload when conversion is off
+            cap.set(cv2.CAP_PROP_CONVERT_RGB, 0)
+        return cap
+
     def _get_frame(self, cap):
-        # Read the frameq
-        ret, frame = cap.read()
+        # Read the frame: grab() pulls it off the device, retrieve() decodes it
+        if not cap.grab():
+            return None
+        ret, frame = cap.retrieve()
         # Check if the frame was read successfully
         if not ret:
             return None
-        # Fix: Convert BGR to RGB color space
-        # OpenCV captures in BGR but PIL expects RGB format
-        # This prevents the blue tint in the video feed
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        img = PIL.Image.fromarray(frame_rgb)  # Now using RGB frame
-        img.thumbnail([1024, 1024])
-
-        image_io = io.BytesIO()
-        img.save(image_io, format="jpeg")
-        image_io.seek(0)
 
         mime_type = "image/jpeg"
-        image_bytes = image_io.read()
-        return {"mime_type": mime_type, "data": base64.b64encode(image_bytes).decode()}
+        # MJPG passthrough: the buffer is already a JPEG (SOI marker 0xFFD8)
+        raw = frame.reshape(-1)
+        if frame.ndim < 3 and raw.size > 2 and raw[0] == 0xFF and raw[1] == 0xD8:
+            return types.Blob(data=raw.tobytes(), mime_type=mime_type)
+
+        # Downscale to fit within 1024x1024, keeping the aspect ratio
+        frame = downscale(frame, 1024, 1024)
+
+        # OpenCV captures in BGR; the encoder takes BGR natively, so no
+        # colour conversion pass is needed (and no blue tint either)
+        image_bytes = encode_jpeg(frame, colorspace="BGR")
+        return types.Blob(data=image_bytes, mime_type=mime_type)
 
     async def get_frames(self):
         # This takes about a second, and will block the whole program
         # causing the audio pipeline to overflow if you don't use thread pool.
-        loop = asyncio.get_event_loop()
-        cap = await loop.run_in_executor(
-            thread_pool, cv2.VideoCapture, 0
-        )  # 0 represents the default camera
+        loop = asyncio.get_running_loop()
+        cap = await loop.run_in_executor(video_pool, self._open_camera)
 
         while True:
-            frame = await loop.run_in_executor(thread_pool, self._get_frame, cap)
+            if self.out_queue.full():
+                # Pipeline is behind: discard the stale frame without decoding
+                # or encoding it, and check again shortly
+                await loop.run_in_executor(video_pool, cap.grab)
+                await asyncio.sleep(0.1)
+                continue
+
+            frame = await loop.run_in_executor(video_pool, self._get_frame, cap)
             if frame is None:
                 break
 
@@ -140,33 +324,32 @@ class AudioLoop:
         cap.release()
 
     def _get_screen(self):
-        sct = mss.mss()
-        monitor = sct.monitors[0]
+        with self._sct_lock:
+            # Reuse one mss instance instead of reopening display handles every grab
+            if self._sct is None:
+                self._sct = mss.mss()
+            monitor = self._sct.monitors[0]
 
-        i = sct.grab(monitor)
+            i = self._sct.grab(monitor)
 
+        return self._encode_screen(i)
+
+    def _encode_screen(self, i):
+        """Encode an mss screenshot as a JPEG blob"""
         mime_type = "image/jpeg"
-        # Convert directly to PIL Image from raw RGB data
-        img = PIL.Image.frombytes("RGB", i.size, i.rgb)
-        
-        # Resize for faster processing (max 640px wide)
-        if img.width > 640:
-            aspect_ratio = img.height / img.width
-            new_width = 640
-            new_height = int(new_width * aspect_ratio)
-            img = img.resize((new_width, new_height), PIL.Image.Resampling.LANCZOS)
+        # View the BGRA framebuffer in place; the encoder ignores the X byte
+        frame = np.frombuffer(i.raw, dtype=np.uint8).reshape(i.height, i.width, 4)
 
-        image_io = io.BytesIO()
-        img.save(image_io, format="jpeg", quality=75, optimize=True)
-        image_io.seek(0)
+        # Resize for faster processing (max 640px wide)
+        frame = downscale(frame, 640)
 
-        image_bytes = image_io.read()
-        return {"mime_type": mime_type, "data": base64.b64encode(image_bytes).decode()}
+        image_bytes = encode_jpeg(frame, colorspace="BGRX")
+        return types.Blob(data=image_bytes, mime_type=mime_type)
 
     async def get_screen(self):
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         while True:
-            frame = await loop.run_in_executor(thread_pool, self._get_screen)
+            frame = await loop.run_in_executor(video_pool, self._get_screen)
             if frame is None:
                 break
 
@@ -175,36 +358,58 @@ class AudioLoop:
             await self.out_queue.put(frame)
 
     async def send_realtime(self):
+        # Producers queue ready-made types.Blob objects; video ones are built
+        # on the capture thread, so nothing is re-wrapped here
         while True:
-            msg = await self.out_queue.get()
-            if isinstance(msg, dict) and msg.get("mime_type") == "audio/pcm":
+            blob = await self.out_queue.get()
+            if blob.mime_type == "audio/pcm":
                 # Send audio data for transcription
-                await self.session.send_realtime_input(
-                    audio=types.Blob(data=msg["data"], mime_type="audio/pcm")
-                )
+                await self.session.send_realtime_input(audio=blob)
             else:
                 # Send other media (images, etc.)
-                data_bytes = base64.b64decode(msg.get("data")) if isinstance(msg, dict) else msg
-                mime_type = msg.get("mime_type", "image/jpeg") if isinstance(msg, dict) else "image/jpeg"
-                await self.session.send_realtime_input(
-                    media=types.Blob(data=data_bytes, mime_type=mime_type)
-                )
+                await self.session.send_realtime_input(media=blob)
 
-    async def listen_audio(self):
-        loop = asyncio.get_event_loop()
-        mic_info = pya.get_default_input_device_info()
-        # Use keyword args via lambda for Python 3.9 executor
-        self.audio_stream = await loop.run_in_executor(
-            thread_pool,
-            lambda: pya.open(
+    def _open_streams(self):
+        """Open the mic and speaker streams once, before the event loop tasks start"""
+        if self.audio_stream is None:
+            # A missing or busy mic isn't fatal: text chat, video and
+            # playback keep running, only listen_audio sits idle
+            try:
+                self.audio_stream = pya.open(
+                    format=FORMAT,
+                    channels=CHANNELS,
+                    rate=SEND_SAMPLE_RATE,
+                    input=True,
+                    input_device_index=DEFAULT_INPUT_DEVICE_INDEX,
+                    frames_per_buffer=MIC_BATCH_SIZE,
+                )
+            except IOError as e:
+                self.report_error(f"Microphone unavailable, continuing without audio input: {e}")
+        if self.play_stream is None:
+            self.play_stream = pya.open(
                 format=FORMAT,
                 channels=CHANNELS,
-                rate=SEND_SAMPLE_RATE,
-                input=True,
-                input_device_index=mic_info["index"],
+                rate=RECEIVE_SAMPLE_RATE,
+                output=True,
                 frames_per_buffer=CHUNK_SIZE,
-            ),
-        )
+            )
+
+    def _close_streams(self):
+        """Close the mic and speaker streams if they were opened"""
+        for stream in (self.audio_stream, self.play_stream):
+            if stream is not None:
+                stream.close()
+        self.audio_stream = None
+        self.play_stream = None
+
+    def report_error(self, message):
+        """Report a non-fatal error without ending the session"""
+        print(message, file=sys.stderr)
+
+    async def listen_audio(self):
+        if self.audio_stream is None:
+            return  # No mic; see _open_streams
+        loop = asyncio.get_running_loop()
         if __debug__:
             kwargs = {"exception_on_overflow": False}
         else:
@@ -212,10 +417,10 @@ class AudioLoop:
         while True:
             # Use lambda to pass kwargs
             data = await loop.run_in_executor(
-                thread_pool,
-                lambda: self.audio_stream.read(CHUNK_SIZE, **kwargs),
+                audio_pool,
+                lambda: self.audio_stream.read(MIC_BATCH_SIZE, **kwargs),
             )
-            await self.out_queue.put({"data": data, "mime_type": "audio/pcm"})
+            await self.out_queue.put(types.Blob(data=data, mime_type="audio/pcm"))
 
     async def receive_audio(self):
         "Background task to reads from the websocket and write pcm chunks to the output queue"
@@ -223,7 +428,7 @@ class AudioLoop:
             turn = self.session.receive()
             async for response in turn:
                 if data := response.data:
-                    self.audio_in_queue.put_nowait(data)
+                    self.audio_in_ring.put(data)
                     continue
                 if text := response.text:
                     print(text, end="")
@@ -232,36 +437,33 @@ class AudioLoop:
             # For interruptions to work, we need to stop playback.
             # So empty out the audio queue because it may have loaded
             # much more audio than has played yet.
-            while not self.audio_in_queue.empty():
-                self.audio_in_queue.get_nowait()
+            self.audio_in_ring.clear()
 
     async def play_audio(self):
-        loop = asyncio.get_event_loop()
-        # Use keyword args via lambda for Python 3.9 executor
-        stream = await loop.run_in_executor(
-            thread_pool,
-            lambda: pya.open(
-                format=FORMAT,
-                channels=CHANNELS,
-                rate=RECEIVE_SAMPLE_RATE,
-                output=True,
-                frames_per_buffer=CHUNK_SIZE,
-            ),
-        )
+        loop = asyncio.get_running_loop()
         while True:
-            bytestream = await self.audio_in_queue.get()
-            await loop.run_in_executor(thread_pool, lambda: stream.write(bytestream))
+            await self.audio_in_ring.wait()
+            # Take everything buffered so far (bounded to keep latency low), so a
+            # burst of response chunks becomes a single PortAudio write
+            bytestream = self.audio_in_ring.pop(PLAYBACK_BATCH_BYTES)
+            await loop.run_in_executor(audio_pool, self.play_stream.write, bytestream)
 
     async def run(self):
         global client
         if client is None:
             client = get_client()
-        
+
         try:
+            # Prime PortAudio up front so the first loop tick isn't spent opening
+            # devices; inside the try so a half-opened pair is still closed
+            self._open_streams()
+
             async with client.aio.live.connect(model=MODEL, config=CONFIG) as session:
                 self.session = session
 
-                self.audio_in_queue = asyncio.Queue()
+                # Memory guard only: 10 min of 16-bit received audio, far more
+                # than any reply; the turn-end clear() normally empties it
+                self.audio_in_ring = AudioRingBuffer(RECEIVE_SAMPLE_RATE * 2 * 600)
                 self.out_queue = asyncio.Queue(maxsize=5)
 
                 # Create tasks manually for Python 3.9 compatibility
@@ -278,35 +480,52 @@ class AudioLoop:
                 tasks.append(asyncio.create_task(self.receive_audio()))
                 tasks.append(asyncio.create_task(self.play_audio()))
 
-                # Wait for the first task to complete (send_text)
-                await tasks[0]
+                # Wait until send_text finishes or any task fails, so a dead
+                # mic or camera tears the session down instead of going unnoticed
+                failed = None
+                pending = set(tasks)
+                while tasks[0] in pending and failed is None:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    failed = next(
+                        (t for t in done if not t.cancelled() and t.exception()),
+                        None,
+                    )
                 
                 # Cancel all other tasks
-                for task in tasks[1:]:
+                for task in pending:
                     task.cancel()
                 
                 # Wait for all tasks to finish
-                await asyncio.gather(*tasks, return_exceptions=True)
+                await asyncio.gather(*pending, return_exceptions=True)
+
+                if failed is not None:
+                    failed.result()  # re-raise the task's exception
 
         except asyncio.CancelledError:
             pass
         except Exception as e:
-            if hasattr(self, 'audio_stream'):
-                self.audio_stream.close()
             traceback.print_exception(type(e), e, e.__traceback__)
+        finally:
+            shutdown_thread_pools()
+            self._close_streams()
 
 
 # ============================================
 # MCP (Model Context Protocol) Integration
 # ============================================
 
+# Process environment snapshot shared by every MCP server launch
+BASE_ENV = dict(os.environ)
+
 class MCPClient:
     """
     MCP Client for connecting to and executing tools on MCP servers.
     Supports stdio transport for local MCP server processes.
     """
     
-    def __init__(self, server_name, server_command, server_args, server_env=None):
+    def __init__(self, server_name, server_command, server_args, server_env=None, tool_cache=None, max_in_flight=8):
         self.server_name = server_name
         self.server_command = server_command
         self.server_args = server_args
@@ -314,27 +533,49 @@ class MCPClient:
         self.process = None
         self.tools = []
         self.connected = False
-        self.request_id = 0
+        self.server_version = None
+        # Shared {(cache_key, server_version): tools} so reconnects skip tools/list
+        self.tool_cache = tool_cache
+        # Called with this client whenever its tool list is refreshed
+        self.on_tools_changed = None
+        # Monotonic JSON-RPC request ids: 1, 2, 3, ...
+        self._next_request_id = count(1).__next__
+        # In-flight requests by JSON-RPC id, resolved by the reader task
+        self._pending = {}
+        self._reader_task = None
+        self._stderr_task = None
+        # Set once a request times out or the transport fails; such a
+        # server may be hung, so it is never handed out from the pool again
+        self._faulted = False
+        # Outgoing frames queued during the current loop tick
+        self._send_buf = []
+        # Resolved once the pending batch has been handed to the pipe
+        self._flush_done = None
+        # Caps concurrent tool calls against this server
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        # Pre-serialized tools/call envelope prefix per tool name
+        self._tool_call_prefixes = {}
         
     async def connect(self):
         """Start MCP server process and establish connection"""
         try:
-            import subprocess
+            # Prepare environment (only copy when there are overrides)
+            env = BASE_ENV | self.server_env if self.server_env else BASE_ENV
             
-            # Prepare environment
-            env = os.environ.copy()
-            env.update(self.server_env)
-            
-            # Start MCP server process
-            self.process = subprocess.Popen(
-                [self.server_command] + self.server_args,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+            # Start MCP server process with non-blocking asyncio pipes
+            self.process = await asyncio.create_subprocess_exec(
+                self.server_command,
+                *self.server_args,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
                 env=env,
-                text=True,
-                bufsize=1
+                limit=1 << 20  # buffer large tool results without pausing the pipe
             )
+            self._reader_task = asyncio.create_task(self._reader())
+            # Nothing else reads the server's stderr; if it isn't drained the
+            # pipe fills up and the server blocks mid-write
+            self._stderr_task = asyncio.create_task(self._drain_stderr())
             
             # Send initialize request
             init_response = await self._send_request({
@@ -353,6 +594,8 @@ class MCPClient:
             
             if init_response and "result" in init_response:
                 self.connected = True
+                server_info = init_response["result"].get("serverInfo") or {}
+                self.server_version = server_info.get("version")
                 
                 # Send initialized notification
                 await self._send_notification({
@@ -360,8 +603,13 @@ class MCPClient:
                     "method": "notifications/initialized"
                 })
                 
-                # List available tools
-                await self.list_tools()
+                # List available tools, unless an identical server at the same
+                # version has already reported them
+                cached_tools = self._cached_tools()
+                if cached_tools is not None:
+                    self.tools = cached_tools
+                else:
+                    await self.list_tools()
                 
                 return True
             else:
@@ -383,6 +631,10 @@ class MCPClient:
             
             if response and "result" in response:
                 self.tools = response["result"].get("tools", [])
+                if self.tool_cache is not None and self.server_version is not None:
+                    self.tool_cache[(self.cache_key, self.server_version)] = self.tools
+                if self.on_tools_changed:
+                    self.on_tools_changed(self)
                 return self.tools
             else:
                 print(f"Failed to list tools from {self.server_name}", file=sys.stderr)
@@ -395,15 +647,11 @@ class MCPClient:
     async def execute_tool(self, tool_name, parameters):
         """Execute a tool with given parameters"""
         try:
-            response = await self._send_request({
-                "jsonrpc": "2.0",
-                "id": self._next_request_id(),
-                "method": "tools/call",
-                "params": {
-                    "name": tool_name,
-                    "arguments": parameters
-                }
-            })
+            async with self._in_flight:
+                request_id = self._next_request_id()
+                response = await self._send_encoded_request(
+                    request_id, self._encode_tool_call(request_id, tool_name, parameters)
+                )
             
             if response and "result" in response:
                 return {
@@ -435,44 +683,141 @@ class MCPClient:
                 "tool": tool_name
             }
     
+    @property
+    def cache_key(self):
+        """Identifies the server process (command, args, env) for pooling and caching"""
+        return (self.server_command, tuple(self.server_args), frozenset(self.server_env.items()))
+    
+    @property
+    def alive(self):
+        """True if connected, the server process is still running and no request has faulted"""
+        return (self.connected and not self._faulted
+                and self.process is not None and self.process.returncode is None)
+    
+    async def ping(self, timeout=2.0):
+        """Check that the server still answers requests, within a short timeout"""
+        request_id = self._next_request_id()
+        frame = json_dumps({"jsonrpc": "2.0", "method": "ping", "id": request_id}) + b"\n"
+        try:
+            # Any reply, even a method-not-found error, shows it is responsive
+            await self._send_encoded_request(request_id, frame, timeout=timeout)
+            return True
+        except Exception:
+            return False
+    
+    def _cached_tools(self):
+        """Return tools cached for this server and version, if any"""
+        if self.tool_cache is None or self.server_version is None:
+            return None
+        return self.tool_cache.get((self.cache_key, self.server_version))
+    
     async def disconnect(self):
         """Disconnect from MCP server"""
+        for task in (self._reader_task, self._stderr_task):
+            if task:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        self._reader_task = None
+        self._stderr_task = None
         if self.process:
             try:
                 self.process.terminate()
-                self.process.wait(timeout=5)
-            except:
+                await asyncio.wait_for(self.process.wait(), timeout=5)
+            except asyncio.TimeoutError:
                 self.process.kill()
+                await self.process.wait()
+            except ProcessLookupError:
+                pass  # already exited
             self.process = None
         self.connected = False
     
+    def _encode_tool_call(self, request_id, tool_name, parameters):
+        """Serialize a tools/call request, reusing the constant envelope for this tool"""
+        prefix = self._tool_call_prefixes.get(tool_name)
+        if prefix is None:
+            prefix = (b'{"jsonrpc":"2.0","method":"tools/call","params":{"name":'
+                      + json_dumps(tool_name) + b',"arguments":')
+            self._tool_call_prefixes[tool_name] = prefix
+        return b"".join((
+            prefix, json_dumps(parameters), b'},"id":', str(request_id).encode(), b"}\n"
+        ))
+    
     async def _send_request(self, request):
         """Send JSON-RPC request and wait for response"""
+        return await self._send_encoded_request(request["id"], json_dumps(request) + b"\n")
+    
+    async def _send_encoded_request(self, request_id, frame, timeout=30.0):
+        """Send an already-serialized JSON-RPC request and wait for its response"""
         if not self.process:
             raise Exception("Server process not started")
         
+        response = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = response
         try:
             # Send request
-            request_json = json.dumps(request) + "\n"
-            self.process.stdin.write(request_json)
-            self.process.stdin.flush()
-            
-            # Read response (with timeout)
-            loop = asyncio.get_event_loop()
-            response_line = await asyncio.wait_for(
-                loop.run_in_executor(None, self.process.stdout.readline),
-                timeout=30.0
-            )
+            await self._write(frame)
             
-            if response_line:
-                return json.loads(response_line)
-            else:
-                raise Exception("No response from server")
+            # Wait for the reader task to deliver the response (with timeout)
+            return await asyncio.wait_for(response, timeout=timeout)
                 
         except asyncio.TimeoutError:
+            self._faulted = True
             raise Exception("Request timeout")
         except Exception as e:
+            self._faulted = True
             raise Exception(f"Request failed: {e}")
+        finally:
+            self._pending.pop(request_id, None)
+    
+    async def _reader(self):
+        """Read server messages and hand each response to its waiting request"""
+        buffer = bytearray()
+        try:
+            while True:
+                # Read in large blocks and split frames ourselves rather than
+                # letting readline() rescan and copy the buffer per line
+                chunk = await self.process.stdout.read(65536)
+                if not chunk:
+                    break
+                # Leftover bytes hold no newline, so only scan the new chunk;
+                # rescanning a large partial frame per read is quadratic
+                scan = len(buffer)
+                buffer.extend(chunk)
+                start = 0
+                with memoryview(buffer) as view:
+                    while (newline := buffer.find(b"\n", scan)) >= 0:
+                        # Parse straight from the buffer without copying the frame
+                        with view[start:newline] as frame:
+                            try:
+                                message = json_loads(frame)
+                            except json.JSONDecodeError:
+                                message = None
+                                if buffer[start:newline].strip():
+                                    print(f"Ignoring non-JSON output from {self.server_name}", file=sys.stderr)
+                        start = scan = newline + 1
+                        if message is not None:
+                            self._dispatch(message)
+                # Views are released above; a bytearray can't shrink while exported
+                del buffer[:start]
+        finally:
+            # Server went away: fail everything still waiting
+            for response in self._pending.values():
+                if not response.done():
+                    response.set_exception(Exception("No response from server"))
+    
+    async def _drain_stderr(self):
+        """Forward the server's stderr to ours so its logs stay visible"""
+        while chunk := await self.process.stderr.read(4096):
+            sys.stderr.buffer.write(chunk)
+            sys.stderr.buffer.flush()
+    
+    def _dispatch(self, message):
+        """Resolve the pending request matching a JSON-RPC response"""
+        if not isinstance(message, dict) or "method" in message:
+            return  # server-initiated request/notification, not a response
+        response = self._pending.pop(message.get("id"), None)
+        if response is not None and not response.done():
+            response.set_result(message)
     
     async def _send_notification(self, notification):
         """Send JSON-RPC notification (no response expected)"""
@@ -480,16 +825,34 @@ class MCPClient:
             return
         
         try:
-            notification_json = json.dumps(notification) + "\n"
-            self.process.stdin.write(notification_json)
-            self.process.stdin.flush()
+            await self._write(json_dumps(notification) + b"\n")
         except Exception as e:
             print(f"Failed to send notification: {e}", file=sys.stderr)
     
-    def _next_request_id(self):
-        """Generate next request ID"""
-        self.request_id += 1
-        return self.request_id
+    async def _write(self, frame):
+        """Send a frame; everything queued in one tick is written together"""
+        self._send_buf.append(frame)
+        if self._flush_done is None:
+            self._flush_done = asyncio.get_running_loop().create_future()
+            asyncio.get_running_loop().call_soon(self._flush_writes)
+        # Shielded: the batch is shared, so one cancelled sender must not
+        # cancel it for the rest. Once it is written, drain() applies
+        # backpressure for this frame too.
+        await asyncio.shield(self._flush_done)
+        await self.process.stdin.drain()
+    
+    def _flush_writes(self):
+        """Write all queued frames to the server with a single pipe write"""
+        done, self._flush_done = self._flush_done, None
+        try:
+            if self.process and self._send_buf:
+                self.process.stdin.writelines(self._send_buf)
+        except Exception as e:
+            done.set_exception(Exception(f"Failed to write to MCP server {self.server_name}: {e}"))
+        else:
+            done.set_result(None)
+        finally:
+            self._send_buf.clear()
     
     def get_status(self):
         """Get current connection status"""
@@ -507,19 +870,41 @@ class MCPServerManager:
     for tool execution across all servers.
     """
     
-    def __init__(self):
+    def __init__(self, max_idle=8):
         self.servers = {}
         self.tool_registry = {}
+        # Registry keys contributed by each server, for incremental removal
+        self._tool_keys_by_server = {}
+        # Pre-serialized get_server_status()/get_all_tools() snapshots, None when stale
+        self._status_json = None
+        self._tools_json = None
+        # Removed-but-still-running clients, LRU order, keyed by MCPClient.cache_key
+        self._pool = OrderedDict()
+        self.max_idle = max_idle
+        self._tool_cache = {}
     
     async def add_server(self, server_name, command, args, env=None):
         """Add and connect to a new MCP server"""
         try:
-            client = MCPClient(server_name, command, args, env)
-            connected = await client.connect()
+            client = MCPClient(server_name, command, args, env, tool_cache=self._tool_cache)
+            pooled = self._pool.pop(client.cache_key, None)
+            # Removing and re-adding is how a hung server gets restarted, so
+            # only reuse a pooled process that has never faulted and still answers
+            if pooled is not None and pooled.alive and await pooled.ping():
+                # Reuse the warm server process from an earlier remove_server
+                pooled.server_name = server_name
+                client = pooled
+                connected = True
+            else:
+                if pooled is not None:
+                    await pooled.disconnect()
+                connected = await client.connect()
             
             if connected:
                 self.servers[server_name] = client
-                await self._update_tool_registry()
+                client.on_tools_changed = self._on_tools_changed
+                self._register_server_tools(client)
+                self._invalidate_snapshots()
                 return {
                     "success": True,
                     "server": server_name,
@@ -540,9 +925,11 @@ class MCPServerManager:
     async def remove_server(self, server_name):
         """Remove and disconnect from an MCP server"""
         if server_name in self.servers:
-            await self.servers[server_name].disconnect()
-            del self.servers[server_name]
-            await self._update_tool_registry()
+            client = self.servers.pop(server_name)
+            client.on_tools_changed = None
+            await self._release(client)
+            self._unregister_server_tools(server_name)
+            self._invalidate_snapshots()
             return {"success": True}
         else:
             return {
@@ -550,10 +937,30 @@ class MCPServerManager:
                 "error": f"Server {server_name} not found"
             }
     
+    async def _release(self, client):
+        """Park a removed client in the idle pool, disconnecting the least recently used overflow"""
+        if not client.alive:
+            await client.disconnect()
+            return
+        key = client.cache_key
+        displaced = self._pool.pop(key, None)
+        if displaced is not None:
+            await displaced.disconnect()
+        self._pool[key] = client
+        while len(self._pool) > self.max_idle:
+            _, evicted = self._pool.popitem(last=False)
+            await evicted.disconnect()
+    
     async def get_all_tools(self):
         """Get all tools from all connected servers"""
         return self.tool_registry
     
+    def get_all_tools_json(self):
+        """Get the tool registry as JSON bytes, serialized once per change"""
+        if self._tools_json is None:
+            self._tools_json = json_dumps(self.tool_registry)
+        return self._tools_json
+    
     async def execute_tool(self, server_name, tool_name, parameters):
         """Execute a tool on a specific server"""
         if server_name not in self.servers:
@@ -571,6 +978,27 @@ class MCPServerManager:
         
         return await client.execute_tool(tool_name, parameters)
     
+    async def execute_tools_batch(self, calls):
+        """
+        Execute several (server_name, tool_name, parameters) calls concurrently.
+        Calls to different servers run in parallel; each server's semaphore caps
+        its own in-flight requests. Results are returned in call order.
+        """
+        results = await asyncio.gather(
+            *(self.execute_tool(server_name, tool_name, parameters)
+              for server_name, tool_name, parameters in calls),
+            return_exceptions=True
+        )
+        return [
+            {
+                "success": False,
+                "error": str(result),
+                "server": server_name,
+                "tool": tool_name
+            } if isinstance(result, Exception) else result
+            for (server_name, tool_name, _), result in zip(calls, results)
+        ]
+    
     def get_server_status(self, server_name=None):
         """Get status of one or all servers"""
         if server_name:
@@ -584,18 +1012,47 @@ class MCPServerManager:
                 for server, client in self.servers.items()
             }
     
-    async def _update_tool_registry(self):
-        """Update the tool registry with all available tools"""
-        self.tool_registry = {}
-        for server_name, client in self.servers.items():
-            for tool in client.tools:
-                tool_key = f"{server_name}_{tool['name']}"
-                self.tool_registry[tool_key] = {
-                    "server": server_name,
-                    "name": tool["name"],
-                    "description": tool.get("description", ""),
-                    "inputSchema": tool.get("inputSchema", {})
-                }
+    def get_server_status_json(self):
+        """Get the status of all servers as JSON bytes, serialized once per change"""
+        if self._status_json is None:
+            self._status_json = json_dumps(self.get_server_status())
+        return self._status_json
+    
+    def _invalidate_snapshots(self):
+        """Drop the cached status/tools JSON after servers or tools change"""
+        self._status_json = None
+        self._tools_json = None
+    
+    def _on_tools_changed(self, client):
+        """Refresh a server's registry entries after it re-lists its tools"""
+        if self.servers.get(client.server_name) is client:
+            self._register_server_tools(client)
+            self._invalidate_snapshots()
+    
+    def _register_server_tools(self, client):
+        """Add one server's tools to the registry, replacing any it registered before"""
+        server_name = client.server_name
+        self._unregister_server_tools(server_name)
+        prefix = server_name + "_"
+        registry = self.tool_registry
+        keys = []
+        for tool in client.tools:
+            name = tool["name"]
+            get = tool.get
+            tool_key = prefix + name
+            registry[tool_key] = {
+                "server": server_name,
+                "name": name,
+                "description": get("description", ""),
+                "inputSchema": get("inputSchema", {})
+            }
+            keys.append(tool_key)
+        self._tool_keys_by_server[server_name] = keys
+    
+    def _unregister_server_tools(self, server_name):
+        """Remove one server's tools from the registry"""
+        for tool_key in self._tool_keys_by_server.pop(server_name, ()):
+            self.tool_registry.pop(tool_key, None)
 
 
 class ElectronGeminiService(AudioLoop):
@@ -603,23 +1060,66 @@ class ElectronGeminiService(AudioLoop):
     
     def __init__(self, video_mode="none"):
         super().__init__(video_mode)
-        self.command_queue = Queue()
+        self.command_queue = None
+        self._loop = None
+        self._loop_ready = threading.Event()
         self.electron_mode = True
         self.is_running = False
         self.transcription_mode = False
-        self.transcription_buffer = []
+        # UTF-8 transcript accumulated while in transcription mode
+        self.transcription_buffer = bytearray()
+
+        # Screen/camera capture thread, started and stopped with the session
+        self._capture_thread = None
+        self._capture_stop = None
+
+        # Frames are written as bytes straight to the binary stdout; the lock
+        # keeps frames from the command thread and the event loop from interleaving.
+        # Under PYTHONUNBUFFERED the binary layer is a raw FileIO, so add a buffer
+        # to get complete writes and to batch audio frames between flushes.
+        out = sys.stdout.buffer
+        if not hasattr(out, "raw"):
+            # closefd=False so the wrapper never closes the real stdout
+            out = os.fdopen(out.fileno(), "wb", closefd=False)
+        self._out = out
+        self._out_lock = threading.Lock()
         
         # Initialize MCP Server Manager
         self.mcp_manager = MCPServerManager()
+
+        # Electron command name -> handler coroutine
+        self._command_handlers = {
+            "start": self._handle_start,
+            "stop": self._handle_stop,
+            "message": self._handle_message,
+            "interrupt": self._handle_interrupt,
+            "start_transcription": self._handle_start_transcription,
+            "stop_transcription": self._handle_stop_transcription,
+            "mcp_add_server": self._handle_mcp_add_server,
+            "mcp_remove_server": self._handle_mcp_remove_server,
+            "mcp_get_tools": self._handle_mcp_get_tools,
+            "mcp_get_server_tools": self._handle_mcp_get_server_tools,
+            "mcp_execute_tool": self._handle_mcp_execute_tool,
+            "mcp_execute_tools_batch": self._handle_mcp_execute_tools_batch,
+            "mcp_get_status": self._handle_mcp_get_status,
+        }
         
     def handle_electron_commands(self):
         """Handle commands from Electron main process via stdin"""
+        # Read raw bytes through a 64 KiB buffer instead of the text-mode wrapper
+        stdin = os.fdopen(sys.stdin.fileno(), "rb", buffering=1 << 16, closefd=False)
         while True:
             try:
-                line = sys.stdin.readline()
-                if line:
-                    command = json.loads(line.strip())
-                    self.command_queue.put(command)
+                line = stdin.readline()
+                if not line:
+                    break  # Electron closed the pipe
+                command = json_loads(line)
+                self._loop_ready.wait()
+                # Blocks while the queue is full, so a flood of commands
+                # can't grow memory without bound
+                asyncio.run_coroutine_threadsafe(
+                    self.command_queue.put(command), self._loop
+                ).result()
             except json.JSONDecodeError as e:
                 self.send_to_electron("error", {"message": f"Invalid JSON command: {e}"})
             except Exception as e:
@@ -628,144 +1128,206 @@ class ElectronGeminiService(AudioLoop):
     def send_to_electron(self, event_type, data):
         """Send events back to Electron via stdout"""
         try:
-            event = {
+            payload = json_dumps({
                 "type": event_type,
                 "data": data,
                 "timestamp": time.time()
-            }
-            print(json.dumps(event), flush=True)
+            })
+            self._send_frame(FRAME_JSON, payload, flush=True)
         except Exception as e:
             print(f"Error sending to Electron: {e}", file=sys.stderr)
     
+    def send_json_to_electron(self, event_type, data_json):
+        """Send an event whose data is already serialized to JSON bytes"""
+        try:
+            payload = b"".join((
+                b'{"type":', json_dumps(event_type),
+                b',"data":', data_json,
+                b',"timestamp":', json_dumps(time.time()),
+                b"}",
+            ))
+            self._send_frame(FRAME_JSON, payload, flush=True)
+        except Exception as e:
+            print(f"Error sending to Electron: {e}", file=sys.stderr)
+
+    def report_error(self, message):
+        """Surface non-fatal errors to Electron as error events"""
+        self.send_to_electron("error", {"message": message})
+
+    def _send_frame(self, kind, payload, flush=False):
+        """Write one length-prefixed frame to Electron"""
+        with self._out_lock:
+            self._out.write(FRAME_HEADER.pack(kind, len(payload)))
+            self._out.write(payload)
+            if flush:
+                self._out.flush()
+    
     async def process_electron_commands(self):
         """Process commands from Electron in async context"""
+        # The queue must be created on the running loop; the stdin thread waits
+        # for it before posting anything
+        self._loop = asyncio.get_running_loop()
+        self.command_queue = asyncio.Queue(maxsize=1024)
+        self._loop_ready.set()
         while True:
             try:
-                if not self.command_queue.empty():
-                    command = self.command_queue.get_nowait()
-                    
-                    if command["command"] == "start":
-                        options = command.get("options", {})
-                        self.video_mode = options.get("mode", "screen")
-                        await self.start_session(options)
-                    elif command["command"] == "stop":
-                        await self.stop_session()
-                    elif command["command"] == "message":
-                        if self.session:
-                            # Optional image payload first
-                            image = command.get("image")
-                            if image and isinstance(image, dict) and image.get("mime_type") and image.get("data"):
-                                # queue the image for realtime send loop
-                                await self.out_queue.put({
-                                    "mime_type": image["mime_type"],
-                                    "data": image["data"],
-                                })
-                            # Then send text if present
-                            if command.get("text"):
-                                if self.transcription_mode:
-                                    # In transcription mode, send audio transcription prompt
-                                    prompt = f"Please transcribe this audio to text. Only return the transcribed text, nothing else: {command['text']}"
-                                    await self.session.send_client_content(
-                                        turns=types.Content(
-                                            role="user",
-                                            parts=[types.Part(text=prompt)]
-                                        ),
-                                        turn_complete=True
-                                    )
-                                else:
-                                    await self.session.send_client_content(
-                                        turns=types.Content(
-                                            role="user",
-                                            parts=[types.Part(text=command["text"])]
-                                        ),
-                                        turn_complete=True
-                                    )
-                    elif command["command"] == "interrupt":
-                        if self.session:
-                            # Interrupt current AI response
-                            pass
-                    elif command["command"] == "start_transcription":
-                        self.transcription_mode = True
-                        self.transcription_buffer = []
-                        if self.session:
-                            self.send_to_electron("transcription_started", {"message": "Transcription mode enabled, listening for audio"})
-                        else:
-                            self.send_to_electron("error", {"message": "Cannot start transcription: session not ready"})
-                    elif command["command"] == "stop_transcription":
-                        self.transcription_mode = False
-                        if self.transcription_buffer:
-                            full_text = ' '.join(self.transcription_buffer)
-                            self.send_to_electron("transcription_final", {"text": full_text})
-                        self.transcription_buffer = []
-                        self.send_to_electron("transcription_stopped", {})
-                    
-                    # ============================================
-                    # MCP Commands
-                    # ============================================
-                    elif command["command"] == "mcp_add_server":
-                        # Add new MCP server
-                        server_name = command.get("server_name")
-                        server_command = command.get("server_command")
-                        server_args = command.get("server_args", [])
-                        server_env = command.get("server_env", {})
-                        
-                        result = await self.mcp_manager.add_server(
-                            server_name, server_command, server_args, server_env
-                        )
-                        self.send_to_electron("mcp_server_added", result)
-                    
-                    elif command["command"] == "mcp_remove_server":
-                        # Remove MCP server
-                        server_name = command.get("server_name")
-                        result = await self.mcp_manager.remove_server(server_name)
-                        self.send_to_electron("mcp_server_removed", result)
-                    
-                    elif command["command"] == "mcp_get_tools":
-                        # Get all available tools
-                        tools = await self.mcp_manager.get_all_tools()
-                        self.send_to_electron("mcp_tools_response", {
-                            "tools": tools
-                        })
-                    
-                    elif command["command"] == "mcp_get_server_tools":
-                        # Get tools from specific server
-                        server_name = command.get("server_name")
-                        if server_name in self.mcp_manager.servers:
-                            client = self.mcp_manager.servers[server_name]
-                            self.send_to_electron("mcp_server_tools_response", {
-                                "server": server_name,
-                                "tools": client.tools
-                            })
-                        else:
-                            self.send_to_electron("error", {
-                                "message": f"Server {server_name} not found"
-                            })
-                    
-                    elif command["command"] == "mcp_execute_tool":
-                        # Execute MCP tool
-                        server_name = command.get("server")
-                        tool_name = command.get("tool")
-                        parameters = command.get("params", {})
-                        
-                        result = await self.mcp_manager.execute_tool(
-                            server_name, tool_name, parameters
-                        )
-                        self.send_to_electron("mcp_tool_result", result)
-                    
-                    elif command["command"] == "mcp_get_status":
-                        # Get server status
-                        server_name = command.get("server_name")
-                        status = self.mcp_manager.get_server_status(server_name)
-                        self.send_to_electron("mcp_status_response", status)
-                
-                await asyncio.sleep(0.1)
+                command = await self.command_queue.get()
+                handler = self._command_handlers.get(command["command"])
+                if handler:
+                    await handler(command)
+                else:
+                    self.send_to_electron("error", {"message": f"Unknown command {command['command']}"})
             except Exception as e:
                 self.send_to_electron("error", {"message": str(e)})
     
+    async def _handle_start(self, command):
+        """Start the session in the requested video mode"""
+        options = command.get("options", {})
+        # Capture only when explicitly asked for, matching main.js's defaults
+        if options.get("enableVideo"):
+            self.video_mode = options.get("mode", "none")
+        else:
+            self.video_mode = "none"
+        await self.start_session(options)
+    
+    async def _handle_stop(self, command):
+        """Stop the session"""
+        await self.stop_session()
+    
+    async def _handle_message(self, command):
+        """Send a user message, with an optional image, to the model"""
+        if not self.session:
+            return
+        # Optional image payload first
+        image = command.get("image")
+        if image and isinstance(image, dict) and image.get("mime_type") and image.get("data"):
+            # queue the image for realtime send loop; the
+            # send loop expects raw bytes, not base64
+            await self.out_queue.put(types.Blob(
+                data=base64.b64decode(image["data"]),
+                mime_type=image["mime_type"],
+            ))
+        # Then send text if present
+        if command.get("text"):
+            if self.transcription_mode:
+                # In transcription mode, send audio transcription prompt
+                prompt = f"Please transcribe this audio to text. Only return the transcribed text, nothing else: {command['text']}"
+                await self.session.send_client_content(
+                    turns=types.Content(
+                        role="user",
+                        parts=[types.Part(text=prompt)]
+                    ),
+                    turn_complete=True
+                )
+            else:
+                await self.session.send_client_content(
+                    turns=types.Content(
+                        role="user",
+                        parts=[types.Part(text=command["text"])]
+                    ),
+                    turn_complete=True
+                )
+    
+    async def _handle_interrupt(self, command):
+        """Interrupt the current response"""
+        if self.session:
+            # Interrupt current AI response
+            pass
+    
+    async def _handle_start_transcription(self, command):
+        """Enable transcription mode"""
+        self.transcription_mode = True
+        self.transcription_buffer.clear()
+        if self.session:
+            self.send_to_electron("transcription_started", {"message": "Transcription mode enabled, listening for audio"})
+        else:
+            self.send_to_electron("error", {"message": "Cannot start transcription: session not ready"})
+    
+    async def _handle_stop_transcription(self, command):
+        """Disable transcription mode and emit the collected transcript"""
+        self.transcription_mode = False
+        if self.transcription_buffer:
+            full_text = self.transcription_buffer.decode()
+            self.send_to_electron("transcription_final", {"text": full_text})
+        self.transcription_buffer.clear()
+        self.send_to_electron("transcription_stopped", {})
+    
+    # ============================================
+    # MCP Commands
+    # ============================================
+    
+    async def _handle_mcp_add_server(self, command):
+        """Add new MCP server"""
+        server_name = command.get("server_name")
+        server_command = command.get("server_command")
+        server_args = command.get("server_args", [])
+        server_env = command.get("server_env", {})
+        
+        result = await self.mcp_manager.add_server(
+            server_name, server_command, server_args, server_env
+        )
+        self.send_to_electron("mcp_server_added", result)
+    
+    async def _handle_mcp_remove_server(self, command):
+        """Remove MCP server"""
+        server_name = command.get("server_name")
+        result = await self.mcp_manager.remove_server(server_name)
+        self.send_to_electron("mcp_server_removed", result)
+    
+    async def _handle_mcp_get_tools(self, command):
+        """Get all available tools"""
+        tools_json = self.mcp_manager.get_all_tools_json()
+        self.send_json_to_electron("mcp_tools_response", b'{"tools":' + tools_json + b"}")
+    
+    async def _handle_mcp_get_server_tools(self, command):
+        """Get tools from specific server"""
+        server_name = command.get("server_name")
+        if server_name in self.mcp_manager.servers:
+            client = self.mcp_manager.servers[server_name]
+            self.send_to_electron("mcp_server_tools_response", {
+                "server": server_name,
+                "tools": client.tools
+            })
+        else:
+            self.send_to_electron("error", {
+                "message": f"Server {server_name} not found"
+            })
+    
+    async def _handle_mcp_execute_tool(self, command):
+        """Execute MCP tool"""
+        server_name = command.get("server")
+        tool_name = command.get("tool")
+        parameters = command.get("params", {})
+        
+        result = await self.mcp_manager.execute_tool(
+            server_name, tool_name, parameters
+        )
+        self.send_to_electron("mcp_tool_result", result)
+    
+    async def _handle_mcp_execute_tools_batch(self, command):
+        """Execute several MCP tools concurrently"""
+        calls = [
+            (call.get("server"), call.get("tool"), call.get("params", {}))
+            for call in command.get("calls", [])
+        ]
+        results = await self.mcp_manager.execute_tools_batch(calls)
+        self.send_to_electron("mcp_tool_batch_result", {"results": results})
+    
+    async def _handle_mcp_get_status(self, command):
+        """Get server status"""
+        server_name = command.get("server_name")
+        if server_name:
+            status = self.mcp_manager.get_server_status(server_name)
+            self.send_to_electron("mcp_status_response", status)
+        else:
+            self.send_json_to_electron("mcp_status_response", self.mcp_manager.get_server_status_json())
+    
     async def start_session(self, options):
         """Start Gemini Live session"""
         try:
             self.is_running = True
+            if self.video_mode in ("screen", "camera"):
+                self._start_capture(self.video_mode)
             self.send_to_electron("status", {"running": True, "message": "Starting Gemini Live session"})
         except Exception as e:
             self.send_to_electron("error", {"message": f"Failed to start session: {e}"})
@@ -774,6 +1336,7 @@ class ElectronGeminiService(AudioLoop):
         """Stop Gemini Live session"""
         try:
             self.is_running = False
+            self._stop_capture()
             self.send_to_electron("status", {"running": False, "message": "Stopped Gemini Live session"})
         except Exception as e:
             self.send_to_electron("error", {"message": f"Failed to stop session: {e}"})
@@ -789,18 +1352,20 @@ class ElectronGeminiService(AudioLoop):
                 turn = self.session.receive()
                 async for response in turn:
                     if data := response.data:
-                        # Send audio data to Electron
-                        audio_b64 = base64.b64encode(data).decode()
-                        self.send_to_electron("audio", {"data": audio_b64})
+                        # Send raw PCM to Electron; it goes out with the next
+                        # flush (a JSON event or a full buffer), not per chunk
+                        self._send_frame(FRAME_AUDIO, data)
                         
                         # Also queue for local playback
-                        self.audio_in_queue.put_nowait(data)
+                        self.audio_in_ring.put(data)
                         continue
                         
                     if text := response.text:
                         if self.transcription_mode:
                             # In transcription mode, treat text as transcription result
-                            self.transcription_buffer.append(text)
+                            if self.transcription_buffer:
+                                self.transcription_buffer.append(0x20)  # space separator
+                            self.transcription_buffer.extend(text.encode())
                             self.send_to_electron("transcription_partial", {"text": text})
                         else:
                             # Send text to Electron
@@ -810,51 +1375,93 @@ class ElectronGeminiService(AudioLoop):
                 self.send_to_electron("turn_complete", {"completed": True})
 
                 # Handle interruptions
-                while not self.audio_in_queue.empty():
-                    self.audio_in_queue.get_nowait()
+                self.audio_in_ring.clear()
         except Exception as e:
             self.send_to_electron("error", {"message": f"Error in receive_audio: {str(e)}"})
     
     async def get_screen(self):
-        """Override to send screen data to Electron"""
-        loop = asyncio.get_event_loop()
-        while True:
-            if not self.is_running:
-                await asyncio.sleep(1.0)
-                continue
-                
-            frame = await loop.run_in_executor(thread_pool, self._get_screen)
-            if frame is None:
-                break
-
-            # Send screen frame to Electron for debugging/monitoring
-            self.send_to_electron("screen_frame", {"size": "captured"})
-            
-            await asyncio.sleep(1.0)
-            await self.out_queue.put(frame)
+        """Override: screen capture runs on a dedicated thread"""
+        self._start_capture("screen")
     
     async def get_frames(self):
-        """Override to send camera data to Electron"""
-        loop = asyncio.get_event_loop()
-        cap = await loop.run_in_executor(thread_pool, cv2.VideoCapture, 0)
-        
-        while True:
-            if not self.is_running:
-                await asyncio.sleep(1.0)
-                continue
-                
-            frame = await loop.run_in_executor(thread_pool, self._get_frame, cap)
-            if frame is None:
-                break
+        """Override: camera capture runs on a dedicated thread"""
+        self._start_capture("camera")
+    
+    def _start_capture(self, mode):
+        """Start a capture thread for "screen" or "camera" unless one is already running"""
+        if self._capture_thread and self._capture_thread.is_alive() and not self._capture_stop.is_set():
+            return
+        # Each thread gets its own stop event so a quick stop/start can't revive an exiting thread
+        self._capture_stop = threading.Event()
+        target = self._screen_loop if mode == "screen" else self._camera_loop
+        self._capture_thread = threading.Thread(
+            target=target, args=(self._capture_stop,), name=f"{mode}-capture", daemon=True
+        )
+        self._capture_thread.start()
+    
+    def _stop_capture(self):
+        """Signal the capture thread, if any, to exit"""
+        if self._capture_stop is not None:
+            self._capture_stop.set()
+    
+    def _queue_frame(self, frame):
+        """Queue a captured frame on the event loop, dropping it if the send loop is behind"""
+        if not self.out_queue.full():
+            self.out_queue.put_nowait(frame)
+    
+    def _screen_loop(self, stop):
+        """Capture thread: grab the screen about once a second and hand frames to the loop"""
+        # A private mss handle: after a quick stop/start the exiting thread
+        # and its replacement overlap, so they must not share self._sct
+        sct = None
+        try:
+            sct = mss.mss()
+            monitor = sct.monitors[0]
+            while not stop.is_set():
+                frame = self._encode_screen(sct.grab(monitor))
 
-            # Send camera frame to Electron for debugging/monitoring
-            self.send_to_electron("camera_frame", {"size": "captured"})
-            
-            await asyncio.sleep(1.0)
-            await self.out_queue.put(frame)
+                # Send screen frame to Electron for debugging/monitoring
+                if DEBUG_FRAME_EVENTS:
+                    self.send_to_electron("screen_frame", {"size": "captured"})
 
-        cap.release()
+                self._loop.call_soon_threadsafe(self._queue_frame, frame)
+                stop.wait(1.0)
+        except Exception as e:
+            self.send_to_electron("error", {"message": f"Screen capture failed: {e}"})
+        finally:
+            if sct is not None:
+                sct.close()
+    
+    def _camera_loop(self, stop):
+        """Capture thread: read the camera about once a second and hand frames to the loop"""
+        cap = None
+        try:
+            cap = self._open_camera()
+            if not cap.isOpened():
+                self.send_to_electron("error", {"message": "Camera capture failed: no camera available"})
+                return
+            while not stop.is_set():
+                if self.out_queue.full():
+                    # Pipeline is behind: discard the stale frame without encoding it
+                    cap.grab()
+                    stop.wait(0.1)
+                    continue
+
+                frame = self._get_frame(cap)
+                if frame is None:
+                    break
 
+                # Send camera frame to Electron for debugging/monitoring
+                if DEBUG_FRAME_EVENTS:
+                    self.send_to_electron("camera_frame", {"size": "captured"})
+
+                self._loop.call_soon_threadsafe(self._queue_frame, frame)
+                stop.wait(1.0)
+        except Exception as e:
+            self.send_to_electron("error", {"message": f"Camera capture failed: {e}"})
+        finally:
+            if cap is not None:
+                cap.release()
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
@@ -870,6 +1477,9 @@ if __name__ == "__main__":
     if args.mode == "electron":
         # Electron service mode - default to no video capture
         service = ElectronGeminiService(video_mode="none")
+
+        # stdout now carries framed messages only; keep stray prints off it
+        sys.stdout = sys.stderr
         
         # Start command handler thread
         command_thread = threading.Thread(target=service.handle_electron_commands, daemon=True)